@@ -1,32 +1,38 @@
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 import networkx as nx
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
 # Generate placeholder network visualization
 def create_network_placeholder():
+    # random_geometric_graph already places nodes, so no layout pass is needed
     G = nx.random_geometric_graph(20, 0.3)
-    pos = nx.spring_layout(G)
+    pos = nx.get_node_attributes(G, 'pos')
     
-    edge_x = []
-    edge_y = []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    # Nodes are labelled 0..N-1, so positions can be indexed by edge endpoints.
+    # Each edge becomes a (start, end, NaN) segment; Plotly breaks lines at NaN
+    pos_arr = np.array([pos[node] for node in range(G.number_of_nodes())])
+    edges = np.array(list(G.edges()), dtype=int).reshape(-1, 2)
+    segments = np.empty((len(edges), 3, 2))
+    segments[:, 0] = pos_arr[edges[:, 0]]
+    segments[:, 1] = pos_arr[edges[:, 1]]
+    segments[:, 2] = np.nan
+    edge_x = segments[..., 0].ravel()
+    edge_y = segments[..., 1].ravel()
 
-    node_x = [pos[node][0] for node in G.nodes()]
-    node_y = [pos[node][1] for node in G.nodes()]
+    node_x = pos_arr[:, 0]
+    node_y = pos_arr[:, 1]
     
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=edge_x, y=edge_y, mode='lines', line=dict(color='#888'), hoverinfo='none'))
     fig.add_trace(go.Scatter(x=node_x, y=node_y, mode='markers', marker=dict(size=15)))
     
     fig.update_layout(title='Institution Collaboration Network', showlegend=False)
-    fig.write_image("docs/images/network_example.png")
+    return fig
 
 # Generate placeholder map visualization
 def create_map_placeholder():
@@ -38,7 +44,7 @@ def create_map_placeholder():
     fig = px.choropleth(df, locations='country', locationmode='ISO-3',
                        color='value', color_continuous_scale='Viridis',
                        title='Global Collaboration Distribution')
-    fig.write_image("docs/images/map_example.png")
+    return fig
 
 # Generate placeholder trends visualization
 def create_trends_placeholder():
@@ -54,7 +60,7 @@ def create_trends_placeholder():
     df = pd.DataFrame(data)
     fig = px.line(df, x='Year', y='Collaborations', color='Country',
                   title='Collaboration Trends by Country')
-    fig.write_image("docs/images/trends_example.png")
+    return fig
 
 # Generate placeholder summary visualization
 def create_summary_placeholder():
@@ -71,11 +77,21 @@ def create_summary_placeholder():
     fig.add_trace(go.Scatter(x=years, y=trend, mode='lines+markers'), row=2, col=1)
     
     fig.update_layout(height=600, title_text="Collaboration Summary")
-    fig.write_image("docs/images/summary_example.png")
+    return fig
+
+PLACEHOLDERS = {
+    "docs/images/network_example.png": create_network_placeholder,
+    "docs/images/map_example.png": create_map_placeholder,
+    "docs/images/trends_example.png": create_trends_placeholder,
+    "docs/images/summary_example.png": create_summary_placeholder
+}
+
+def render_placeholder(path):
+    """Build the placeholder figure for path and write it as a static image"""
+    pio.write_image(PLACEHOLDERS[path](), path)
 
 if __name__ == "__main__":
-    create_network_placeholder()
-    create_map_placeholder()
-    create_trends_placeholder()
-    create_summary_placeholder()
+    # Placeholders are independent, so render them in parallel worker processes
+    with ProcessPoolExecutor(max_workers=len(PLACEHOLDERS)) as executor:
+        list(executor.map(render_placeholder, PLACEHOLDERS))
     print("Placeholder images generated in docs/images/") 
\ No newline at end of file
@@ -1,14 +1,97 @@
 import os
+import io
+import argparse
+import asyncio
+import aiohttp
+import msgspec
+from aiohttp_client_cache import CachedSession as CachedClientSession, SQLiteBackend
+import numpy as np
 import pandas as pd
 import requests
-from datetime import datetime
+from requests_cache import CachedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Tuple
+from collections import Counter
+import operator
 import logging
 
+# HTTP statuses worth retrying with backoff (rate limiting and transient server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Institution metadata changes slowly, so cached responses stay valid for a week
+CACHE_EXPIRE_AFTER = timedelta(days=7)
+
+# OpenAlex only serves basic (page=N) paging for the first 10,000 results
+MAX_PAGED_RESULTS = 10000
+
+# OpenAlex institution fields mapped to the DataFrame column each is stored in
+INSTITUTION_FIELDS = {
+    'id': 'openalex_id',
+    'display_name': 'display_name',
+    'country_code': 'country_code',
+    'type': 'type',
+    'works_count': 'works_count',
+    'cited_by_count': 'cited_by_count',
+    'ror': 'ror_id',
+    'homepage_url': 'homepage_url',
+    'image_url': 'image_url'
+}
+
+# Key fields for the simplified dataset. Parquet is columnar, so these can be
+# read straight from the full file: pd.read_parquet(path, columns=SIMPLE_COLUMNS)
+SIMPLE_COLUMNS = ['openalex_id', 'display_name', 'country_code', 'type', 'works_count']
+
+class Institution(msgspec.Struct):
+    """OpenAlex institution record, decoded straight from JSON (unlisted fields are skipped)"""
+    id: str
+    display_name: Optional[str] = ''
+    country_code: Optional[str] = ''
+    type: Optional[str] = ''
+    works_count: int = 0
+    cited_by_count: int = 0
+    ror: Optional[str] = ''
+    homepage_url: Optional[str] = ''
+    image_url: Optional[str] = ''
+
+class PageMeta(msgspec.Struct):
+    next_cursor: Optional[str] = None
+
+class InstitutionPage(msgspec.Struct):
+    """A page of the OpenAlex /institutions endpoint"""
+    results: List[Institution] = []
+    meta: PageMeta = msgspec.field(default_factory=PageMeta)
+
+PAGE_DECODER = msgspec.json.Decoder(InstitutionPage)
+
 class InstitutionFetcher:
-    def __init__(self, email: str):
+    def __init__(self, email: str, max_concurrency: int = 10, max_retries: int = 5,
+                 cache_name: str = 'openalex_cache'):
         self.base_url = "https://api.openalex.org"
         self.email = email
         self.headers = {'User-Agent': f'mailto:{email}'}
+        # OpenAlex allows 10 requests/second in the polite pool
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        
+        self.cache_name = cache_name
+        
+        # Country code tallies, filled in while fetching institutions
+        self._country_counter = Counter()
+        
+        # Reuse one keep-alive connection pool for synchronous requests, backed
+        # by an on-disk cache so repeated runs skip the network
+        self.session = CachedSession(cache_name, backend='sqlite',
+                                     expire_after=CACHE_EXPIRE_AFTER, stale_if_error=True)
+        self.session.headers.update({**self.headers, 'Accept-Encoding': 'gzip'})
+        adapter = HTTPAdapter(
+            pool_connections=max_concurrency,
+            pool_maxsize=max_concurrency,
+            max_retries=Retry(total=max_retries, backoff_factor=0.5,
+                              status_forcelist=sorted(RETRY_STATUSES))
+        )
+        self.session.mount('https://', adapter)
         
         # Setup logging
         logging.basicConfig(
@@ -17,73 +100,134 @@ class InstitutionFetcher:
         )
         self.logger = logging.getLogger(__name__)
 
-    def _make_request(self, endpoint: str, params: dict = None) -> dict:
-        """Make a request to the OpenAlex API"""
+    def _make_request(self, endpoint: str, params: dict = None) -> InstitutionPage:
+        """Make a request to the OpenAlex API and decode the page of institutions"""
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return PAGE_DECODER.decode(response.content)
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API request failed: {e}")
             raise
 
+    async def _fetch_page(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                          endpoint: str, params: dict) -> List[Institution]:
+        """Fetch a single page of results, retrying with exponential backoff on 429/5xx"""
+        url = f"{self.base_url}/{endpoint}"
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                try:
+                    async with session.get(url, params=params) as response:
+                        if response.status not in RETRY_STATUSES or attempt == self.max_retries:
+                            response.raise_for_status()
+                            data = PAGE_DECODER.decode(await response.read())
+                            self.logger.info(f"Fetched page {params['page']}")
+                            return data.results
+                except aiohttp.ClientError as e:
+                    self.logger.error(f"API request failed: {e}")
+                    raise
+            
+            delay = 2 ** attempt
+            self.logger.warning(f"Page {params['page']} returned {response.status}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+
+    async def _fetch_all(self, endpoint: str, params: dict, pages: Iterable[int]) -> List[List[Institution]]:
+        """Fetch the given pages concurrently, returning their results in page order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=self.max_concurrency)
+        # requests-cache and aiohttp-client-cache use different storage formats,
+        # so the async cache lives in its own database
+        cache = SQLiteBackend(f'{self.cache_name}_async', expire_after=CACHE_EXPIRE_AFTER)
+        async with CachedClientSession(cache=cache, headers=self.headers, connector=connector) as session:
+            tasks = [self._fetch_page(session, semaphore, endpoint, {**params, 'page': page})
+                     for page in pages]
+            return await asyncio.gather(*tasks)
+
+    def _iter_cursor_pages(self, endpoint: str, params: dict, max_pages: int = None) -> Iterator[List[Institution]]:
+        """Yield pages of results sequentially using OpenAlex cursor pagination"""
+        params = {**params, 'cursor': '*'}
+        page = 0
+        
+        while params['cursor']:
+            if max_pages and page >= max_pages:
+                self.logger.info(f"Reached maximum pages limit: {max_pages}")
+                break
+            
+            page += 1
+            self.logger.info(f"Fetching page {page}")
+            response = self._make_request(endpoint, params)
+            
+            if not response.results:
+                break
+            yield response.results
+            
+            params['cursor'] = response.meta.next_cursor
+
+    def num_countries(self) -> int:
+        """Number of distinct country codes among the last fetched institutions"""
+        return len(self._country_counter)
+
+    def top_countries(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Most common country codes among the last fetched institutions"""
+        return self._country_counter.most_common(n)
+
     def fetch_institutions(self, per_page: int = 200, max_pages: int = None) -> pd.DataFrame:
         """
         Fetch institutions from OpenAlex API
         
+        When all requested pages fall within OpenAlex's basic paging limit they
+        are fetched concurrently; otherwise results are walked with cursor
+        pagination, which has no depth limit.
+        
         Args:
             per_page (int): Number of results per page
             max_pages (int): Maximum number of pages to fetch (None for all)
         """
         params = {
             'per-page': per_page,
-            'page': 1,
             # Sort by works count to get most relevant institutions first
             'sort': 'works_count:desc'
         }
         
-        institutions = []
-        total_processed = 0
+        # Accumulate columnar lists rather than per-row dicts so pandas can
+        # build each column directly without transposing records
+        columns = {column: [] for column in INSTITUTION_FIELDS.values()}
         
-        while True:
-            self.logger.info(f"Fetching page {params['page']}. Total processed: {total_processed}")
-            
-            response = self._make_request('institutions', params)
-            
-            if not response.get('results'):
-                break
-                
-            for inst in response['results']:
-                institutions.append({
-                    'openalex_id': inst['id'],
-                    'display_name': inst.get('display_name', ''),
-                    'country_code': inst.get('country_code', ''),
-                    'type': inst.get('type', ''),
-                    'works_count': inst.get('works_count', 0),
-                    'cited_by_count': inst.get('cited_by_count', 0),
-                    'ror_id': inst.get('ror', ''),
-                    'homepage_url': inst.get('homepage_url', ''),
-                    'image_url': inst.get('image_url', '')
-                })
-            
-            total_processed += len(response['results'])
-            
-            # Check if we've reached max_pages
-            if max_pages and params['page'] >= max_pages:
-                self.logger.info(f"Reached maximum pages limit: {max_pages}")
-                break
-                
-            # Check if there are more pages
-            if total_processed >= response['meta']['count']:
-                break
-                
-            params['page'] += 1
+        if max_pages and max_pages * per_page <= MAX_PAGED_RESULTS:
+            # Every page can be requested up front; pages past the last
+            # result simply come back empty
+            self.logger.info(f"Fetching pages 1-{max_pages} concurrently")
+            pages = asyncio.run(self._fetch_all('institutions', params, range(1, max_pages + 1)))
+        else:
+            pages = self._iter_cursor_pages('institutions', params, max_pages)
+        
+        # Records are already decoded into typed structs with defaults for
+        # missing fields; pull all fields at once, then transpose into columns
+        get_fields = operator.attrgetter(*INSTITUTION_FIELDS)
+        rows = [get_fields(inst) for results in pages for inst in results]
+        for column, values in zip(columns.values(), zip(*rows)):
+            column.extend(values)
+        
+        self._country_counter = Counter(columns['country_code'])
+        self._country_counter.pop(None, None)
         
-        self.logger.info(f"Total institutions fetched: {len(institutions)}")
-        return pd.DataFrame(institutions)
+        self.logger.info(f"Total institutions fetched: {len(columns['openalex_id'])}")
+        return pd.DataFrame(columns, copy=False)
+
+def write_text(path: str, text: str):
+    """Write text to a file as UTF-8 in a single buffered write"""
+    # A binary writer with a 1 MiB buffer skips the TextIOWrapper layer and,
+    # unlike a raw os.write, handles short writes itself
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(text.encode('utf-8'))
 
 def main():
+    parser = argparse.ArgumentParser(description="Fetch institution data from OpenAlex")
+    parser.add_argument('--csv', action='store_true',
+                        help="Save datasets as CSV instead of Parquet")
+    args = parser.parse_args()
+    
     # Create output directory with timestamp
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     output_dir = f'institution_data_{timestamp}'
@@ -96,40 +240,59 @@ def main():
     df = fetcher.fetch_institutions(max_pages=50)  # Fetches first 50 pages
     
     # Save full dataset
-    df.to_csv(f'{output_dir}/institutions_full.csv', index=False)
-    
-    # Save a simplified version with just ID and name
-    df_simple = df[['openalex_id', 'display_name', 'country_code', 'type', 'works_count']]
-    df_simple.to_csv(f'{output_dir}/institutions_simple.csv', index=False)
+    if args.csv:
+        df.to_csv(f'{output_dir}/institutions_full.csv', index=False)
+        
+        # CSV can't be read column-wise, so also save a simplified version with the key fields
+        df.to_csv(f'{output_dir}/institutions_simple.csv', columns=SIMPLE_COLUMNS,
+                  index=False, chunksize=50000)
+    else:
+        df.to_parquet(f'{output_dir}/institutions_full.parquet', compression='snappy', index=False)
     
     # Create a markdown file with top institutions
-    top_institutions = df.nlargest(100, 'works_count')
-    with open(f'{output_dir}/top_institutions.md', 'w', encoding='utf-8') as f:
-        f.write("# Top 100 Institutions by Works Count\n\n")
-        f.write("| OpenAlex ID | Institution Name | Country | Works Count |\n")
-        f.write("|-------------|------------------|---------|-------------|\n")
-        for _, row in top_institutions.iterrows():
-            f.write(f"| {row['openalex_id']} | {row['display_name']} | {row['country_code']} | {row['works_count']:,} |\n")
+    # Partial O(N) top-k selection, then sort only the selected rows
+    works_counts = df['works_count'].to_numpy()
+    top_idx = np.arange(len(works_counts))
+    if len(works_counts) > 100:
+        top_idx = np.argpartition(-works_counts, 100)[:100]
+    top_idx = top_idx[np.argsort(-works_counts[top_idx], kind='stable')]
+    top_institutions = df.iloc[top_idx]
+    # Format all table rows at once instead of iterating rows as Series
+    # (map(str) rather than astype(str): string dtypes keep missing values as NaN)
+    table_rows = ("| " + top_institutions['openalex_id'].map(str) +
+                  " | " + top_institutions['display_name'].map(str) +
+                  " | " + top_institutions['country_code'].map(str) +
+                  " | " + top_institutions['works_count'].map("{:,}".format) + " |")
+    buf = io.StringIO()
+    buf.write("# Top 100 Institutions by Works Count\n\n"
+              "| OpenAlex ID | Institution Name | Country | Works Count |\n"
+              "|-------------|------------------|---------|-------------|\n")
+    buf.write("\n".join(table_rows.tolist()) + "\n")
+    write_text(f'{output_dir}/top_institutions.md', buf.getvalue())
     
     # Create a summary file
-    with open(f'{output_dir}/summary.txt', 'w', encoding='utf-8') as f:
-        f.write("Institution Data Summary\n")
-        f.write("======================\n\n")
-        f.write(f"Total institutions: {len(df):,}\n")
-        f.write(f"Countries represented: {df['country_code'].nunique():,}\n")
-        
-        # Handle None values in institution types
-        institution_types = [str(t) for t in df['type'].unique() if pd.notna(t)]
-        f.write(f"Institution types: {', '.join(institution_types)}\n\n")
-        
-        f.write("Top 10 countries by number of institutions:\n")
-        country_counts = df['country_code'].value_counts().head(10)
-        for country, count in country_counts.items():
-            f.write(f"- {country}: {count:,}\n")
+    buf = io.StringIO()
+    buf.write("Institution Data Summary\n")
+    buf.write("======================\n\n")
+    buf.write(f"Total institutions: {len(df):,}\n")
+    buf.write(f"Countries represented: {fetcher.num_countries():,}\n")
+    
+    # Handle None values in institution types
+    institution_types = df['type'].dropna().astype(str).unique().tolist()
+    buf.write(f"Institution types: {', '.join(institution_types)}\n\n")
+    
+    buf.write("Top 10 countries by number of institutions:\n")
+    # Counted during the fetch, so no extra pass over the DataFrame is needed
+    for country, count in fetcher.top_countries(10):
+        buf.write(f"- {country}: {count:,}\n")
+    write_text(f'{output_dir}/summary.txt', buf.getvalue())
     
     print(f"Data saved in '{output_dir}' directory:")
-    print(f"- Full dataset: institutions_full.csv")
-    print(f"- Simplified dataset: institutions_simple.csv")
+    if args.csv:
+        print(f"- Full dataset: institutions_full.csv")
+        print(f"- Simplified dataset: institutions_simple.csv")
+    else:
+        print(f"- Full dataset: institutions_full.parquet")
     print(f"- Top institutions: top_institutions.md")
     print(f"- Summary: summary.txt")
 
@@ -1,28 +1,84 @@
+import math
+import asyncio
+import aiohttp
+from aiohttp_client_cache import CachedSession as CachedClientSession, SQLiteBackend
+import orjson
 import requests
+from requests_cache import CachedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import networkx as nx
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 import logging
+from datetime import timedelta
+from functools import cached_property
 from plotly.subplots import make_subplots
 import numpy as np
 
+# Responses worth retrying after a back-off
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# OpenAlex only serves the first 10,000 results through page-number paging
+MAX_PAGED_RESULTS = 10000
+WORKS_PER_PAGE = 200
+# Re-runs within a day are served from the on-disk response cache
+CACHE_EXPIRE_AFTER = timedelta(days=1)
+
+COLLABORATION_COLUMNS = ['year', 'collaborating_institution', 'country', 'work_id']
+# Explicit column types so pandas never has to infer them; few distinct institutions
+# and countries repeat across many rows, so categoricals group on integer codes
+COLLABORATION_DTYPES = {
+    'year': 'int16',
+    'collaborating_institution': 'category',
+    'country': 'category',
+    'work_id': object
+}
+COLLABORATION_SCHEMA = pa.schema([
+    ('year', pa.int16()),
+    ('collaborating_institution', pa.string()),
+    ('country', pa.string()),
+    ('work_id', pa.string())
+])
+
 class OpenAlexAnalyzer:
     """
     A class to analyze OpenAlex data and build knowledge graphs
     """
     
-    def __init__(self, email: str):
+    def __init__(self, email: str, max_concurrency: int = 9, max_retries: int = 5,
+                 cache_name: str = 'openalex_cache'):
         """
         Initialize the OpenAlex analyzer
         
         Args:
             email (str): Email for polite pool access to OpenAlex API
+            max_concurrency (int): Maximum number of in-flight page requests
+                                   (OpenAlex allows 10 requests/second)
+            max_retries (int): Retries for rate-limited or failed page requests
+            cache_name (str): SQLite database used to cache API responses across runs
         """
         self.base_url = "https://api.openalex.org"
         self.email = email
         self.headers = {'User-Agent': f'mailto:{email}'}
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.cache_name = cache_name
+        
+        # Reuse pooled keep-alive connections across pages and retry rate limits and server errors,
+        # backed by an on-disk cache so each page (keyed by URL and params) is downloaded once
+        self.session = CachedSession(cache_name, backend='sqlite', expire_after=CACHE_EXPIRE_AFTER)
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=max_retries, backoff_factor=0.5,
+                              status_forcelist=sorted(RETRY_STATUSES))
+        )
+        self.session.mount('https://', adapter)
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
@@ -41,23 +97,128 @@ class OpenAlexAnalyzer:
         """
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
+            # orjson parses the raw bytes several times faster than requests' stdlib decoding
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API request failed: {e}")
             raise
 
+    async def _fetch_page(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                          endpoint: str, params: Dict) -> Dict:
+        """Fetch a single page of results, retrying with exponential backoff on 429/5xx"""
+        url = f"{self.base_url}/{endpoint}"
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                try:
+                    async with session.get(url, params=params) as response:
+                        if response.status not in RETRY_STATUSES or attempt == self.max_retries:
+                            response.raise_for_status()
+                            self.logger.info(f"Fetched page {params['page']}")
+                            return orjson.loads(await response.read())
+                except aiohttp.ClientError as e:
+                    self.logger.error(f"API request failed: {e}")
+                    raise
+            
+            delay = 2 ** attempt
+            self.logger.warning(f"Page {params['page']} returned {response.status}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+
+    async def _fetch_pages(self, endpoint: str, params: Dict, pages: Iterable[int],
+                           on_page: Callable[[Dict], None]) -> None:
+        """
+        Fetch the given pages concurrently, passing each response to on_page in page order
+        
+        Responses that arrive ahead of an earlier page are held until it arrives, so
+        only out-of-order pages are buffered.
+        """
+        pages = list(pages)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=self.max_concurrency)
+        cache = SQLiteBackend(f'{self.cache_name}_async', expire_after=CACHE_EXPIRE_AFTER)
+        async with CachedClientSession(cache=cache, headers=self.headers, connector=connector) as session:
+            async def fetch(page: int):
+                return page, await self._fetch_page(session, semaphore, endpoint, {**params, 'page': page})
+            
+            buffered = {}
+            next_ix = 0
+            for next_response in asyncio.as_completed([fetch(page) for page in pages]):
+                page, response = await next_response
+                buffered[page] = response
+                while next_ix < len(pages) and pages[next_ix] in buffered:
+                    on_page(buffered.pop(pages[next_ix]))
+                    next_ix += 1
+
+    def _iter_cursor_pages(self, endpoint: str, params: Dict) -> Iterator[Dict]:
+        """Yield responses sequentially using OpenAlex cursor pagination"""
+        params = {**params, 'cursor': '*'}
+        total_processed = 0
+        
+        while params['cursor']:
+            self.logger.info(f"Fetching page of results. Total processed: {total_processed}")
+            response = self._make_request(endpoint, params)
+            
+            if not response.get('results'):
+                break
+            yield response
+            total_processed += len(response['results'])
+            
+            params['cursor'] = response.get('meta', {}).get('next_cursor')
+
+    @staticmethod
+    def _flatten_collaborations(results: List[Dict], institution_id: str) -> pd.DataFrame:
+        """
+        Flatten a page of works into one row per authorship with an external first institution
+        
+        Args:
+            results (List[Dict]): Works from one page of API results
+            institution_id (str): OpenAlex ID of the analyzed institution, excluded from the rows
+            
+        Returns:
+            pd.DataFrame: Collaboration rows for the page
+        """
+        authorships = pd.json_normalize(results, record_path='authorships',
+                                        meta=['id', 'publication_year'], errors='ignore')
+        if authorships.empty or 'institutions' not in authorships:
+            return pd.DataFrame(columns=COLLABORATION_COLUMNS)
+        
+        # Only the first listed institution of each authorship counts
+        first_institution = authorships['institutions'].str[0]
+        has_institution = first_institution.notna().to_numpy()
+        institutions = (pd.json_normalize(first_institution[has_institution].tolist())
+                        .reindex(columns=['id', 'display_name', 'country_code']))
+        
+        page = pd.DataFrame({
+            'year': authorships['publication_year'].to_numpy()[has_institution].astype('int16'),
+            'collaborating_institution': institutions['display_name'].to_numpy(),
+            'country': institutions['country_code'].to_numpy(),
+            'work_id': authorships['id'].to_numpy()[has_institution]
+        })
+        external = institutions['id'].notna() & (institutions['id'] != institution_id)
+        return page[external.to_numpy()]
+
     def get_institution_collaborations(self, institution_id: str, 
                                      start_year: int, 
-                                     end_year: int) -> pd.DataFrame:
+                                     end_year: int,
+                                     parquet_path: Optional[str] = None,
+                                     columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Get collaboration data for an institution
         
+        Each page is flattened as soon as it and all earlier pages have arrived, so raw
+        API responses are only held for pages in flight or arriving out of order. Rows
+        keep page order, so results are the same from run to run.
+        
         Args:
             institution_id (str): OpenAlex ID for the institution
             start_year (int): Start year for analysis
             end_year (int): End year for analysis
+            parquet_path (str, optional): Write each page's rows to this Parquet file
+                                          instead of keeping them in memory, then load
+                                          the result from it
+            columns (List[str], optional): Columns to load back from parquet_path
+                                           (default: all)
             
         Returns:
             pd.DataFrame: Collaboration data
@@ -65,54 +226,67 @@ class OpenAlexAnalyzer:
         params = {
             'filter': f'institutions.id:{institution_id},'
                      f'publication_year:{start_year}-{end_year}',
-            'per_page': 200,
-            'cursor': '*'  # Start cursor for pagination
+            # Only these top-level fields are read; OpenAlex cannot select nested fields
+            'select': 'id,publication_year,authorships',
+            'per_page': WORKS_PER_PAGE
         }
+        columns = columns if parquet_path and columns else COLLABORATION_COLUMNS
+        dtypes = {column: COLLABORATION_DTYPES[column] for column in columns}
         
-        collaborations = []
+        collaborations = []  # one DataFrame per page, unless writing to Parquet
+        writer = pq.ParquetWriter(parquet_path, COLLABORATION_SCHEMA) if parquet_path else None
         total_processed = 0
         
+        def add_page(response: Dict) -> None:
+            nonlocal total_processed
+            results = response.get('results', [])
+            # Formatting a nested work is costly, so only do it when debugging
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sample of first result: %s", results[:1])
+            
+            if results:
+                page = self._flatten_collaborations(results, institution_id)
+                if writer:
+                    writer.write_table(pa.Table.from_pandas(page, schema=COLLABORATION_SCHEMA,
+                                                            preserve_index=False))
+                else:
+                    collaborations.append(page)
+            
+            total_processed += len(results)
+        
         try:
-            while True:
-                self.logger.info(f"Fetching page of results. Total processed: {total_processed}")
-                response = self._make_request('works', params)
-                
-                self.logger.info(f"Sample of first result: {response.get('results', [])[:1]}")
-                
-                if not response.get('results'):
-                    if total_processed == 0:
-                        self.logger.warning("No results found for the given parameters")
-                    break
-                    
-                for work in response.get('results', []):
-                    for authorship in work.get('authorships', []):
-                        institutions = authorship.get('institutions', [])
-                        if not institutions:
-                            continue
-                            
-                        institution = institutions[0]
-                        if institution.get('id') and institution.get('id') != institution_id:
-                            collaborations.append({
-                                'year': work.get('publication_year'),
-                                'collaborating_institution': institution.get('display_name'),
-                                'country': institution.get('country_code'),
-                                'work_id': work.get('id')
-                            })
-                
-                total_processed += len(response.get('results', []))
-                
-                # Check for next page
-                next_cursor = response.get('meta', {}).get('next_cursor')
-                if not next_cursor:
-                    break
-                    
-                params['cursor'] = next_cursor
-                
-            df = pd.DataFrame(collaborations)
+            # The first page tells us how many results there are; if they all fit
+            # within page-number paging, request the remaining pages concurrently,
+            # otherwise fall back to sequential cursor pagination
+            first_page = self._make_request('works', {**params, 'page': 1})
+            total_count = first_page.get('meta', {}).get('count') or 0
+            
+            if total_count <= MAX_PAGED_RESULTS:
+                n_pages = math.ceil(total_count / WORKS_PER_PAGE)
+                self.logger.info(f"Fetching {total_count} works in {n_pages} pages concurrently")
+                add_page(first_page)
+                asyncio.run(self._fetch_pages('works', params, range(2, n_pages + 1), add_page))
+            else:
+                self.logger.info(f"{total_count} works exceed the paging limit, using cursor pagination")
+                # Cursor pagination starts over from the first page
+                for response in self._iter_cursor_pages('works', params):
+                    add_page(response)
+            
+            if total_processed == 0:
+                self.logger.warning("No results found for the given parameters")
+            
+            if writer:
+                writer.close()
+                df = pd.read_parquet(parquet_path, columns=columns)
+            else:
+                df = (pd.concat(collaborations, ignore_index=True)
+                      if collaborations else pd.DataFrame())
             if df.empty:
                 self.logger.warning("No collaboration data found")
                 # Return empty DataFrame with expected columns
-                return pd.DataFrame(columns=['year', 'collaborating_institution', 'country', 'work_id'])
+                return pd.DataFrame(columns=columns).astype(dtypes)
+                
+            df = df.astype(dtypes)
                 
             self.logger.info(f"Found {len(df)} collaborations")
             return df
@@ -120,33 +294,91 @@ class OpenAlexAnalyzer:
         except Exception as e:
             self.logger.error(f"Failed to get collaboration data: {e}")
             raise
+        finally:
+            if writer:
+                writer.close()
 
-    def create_collaboration_network(self, df: pd.DataFrame) -> nx.Graph:
+    def create_collaboration_network(self, df: pd.DataFrame, top_n: Optional[int] = None) -> nx.Graph:
         """
         Create a network graph from collaboration data
         
+        Edges are weighted by the number of collaborations with each institution.
+        
         Args:
             df (pd.DataFrame): Collaboration data
+            top_n (int, optional): Keep only the top_n institutions by collaboration count
             
         Returns:
             nx.Graph: NetworkX graph object
         """
         G = nx.Graph()
         
-        for _, row in df.iterrows():
-            if pd.notna(row['collaborating_institution']):
-                G.add_edge('Source Institution', 
-                          row['collaborating_institution'],
-                          year=row['year'])
+        # One weighted edge per institution instead of one edge per collaboration row;
+        # the year attribute keeps the most recently seen collaboration as before
+        edges = (df.dropna(subset=['collaborating_institution'])
+                   .groupby('collaborating_institution', sort=False, observed=True)['year']
+                   .agg(['size', 'last']))
+        if top_n is not None:
+            edges = edges.nlargest(top_n, 'size')
+        G.add_edges_from(
+            ('Source Institution', inst, {'weight': weight, 'year': year})
+            for inst, weight, year in zip(edges.index.tolist(),
+                                          edges['size'].tolist(),
+                                          edges['last'].tolist())
+        )
         
         return G
 
-    def visualize_collaborations_over_time(self, df: pd.DataFrame) -> go.Figure:
+    def compute_aggregates(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """
+        Compute the counts shared by the visualizations in a single pass each
+        
+        Pass the result to the visualization methods via their aggregates
+        argument so several figures don't repeat the same groupby.
+        
+        Args:
+            df (pd.DataFrame): Collaboration data
+            
+        Returns:
+            Dict[str, pd.Series]: Collaborations per year ('yearly'), per institution
+                                  ('institutions'), per country ('countries') and
+                                  per (year, country) ('country_year')
+        """
+        return {
+            'yearly': df.groupby('year').size(),
+            'institutions': df['collaborating_institution'].value_counts(),
+            'countries': df['country'].value_counts(),
+            'country_year': df.groupby(['year', 'country'], observed=True).size()
+        }
+
+    @cached_property
+    def _country_lookup(self) -> pd.DataFrame:
+        """
+        Short name ('country_name') and ISO3 code ('country_code_ISO3') of every country,
+        indexed by ISO2 code
+        
+        Built once from country_converter's bundled table; raises ImportError if the
+        package is missing.
+        """
+        import country_converter as coco
+        data = coco.CountryConverter().data
+        
+        # A few ISO2 entries are regex alternations of several codes (e.g. '^GB$|^UK$');
+        # give each code its own row so all of them resolve
+        codes = data['ISO2'].astype(str).str.strip('^$').str.split(r'\$\|\^')
+        lookup = (data.assign(ISO2=codes).explode('ISO2')
+                      .set_index('ISO2')[['name_short', 'ISO3']])
+        lookup = lookup[~lookup.index.duplicated()]
+        return lookup.rename(columns={'name_short': 'country_name', 'ISO3': 'country_code_ISO3'})
+
+    def visualize_collaborations_over_time(self, df: pd.DataFrame,
+                                           aggregates: Optional[Dict[str, pd.Series]] = None) -> go.Figure:
         """
         Create a time series visualization of collaborations
         
         Args:
             df (pd.DataFrame): Collaboration data
+            aggregates (Dict[str, pd.Series], optional): Precomputed counts from compute_aggregates
             
         Returns:
             go.Figure: Plotly figure object
@@ -161,7 +393,8 @@ class OpenAlexAnalyzer:
             )
             return fig
         
-        yearly_counts = df.groupby('year').size().reset_index(name='count')
+        yearly_counts = aggregates['yearly'] if aggregates else df.groupby('year').size()
+        yearly_counts = yearly_counts.reset_index(name='count')
         
         fig = px.line(yearly_counts, 
                      x='year', 
@@ -171,9 +404,14 @@ class OpenAlexAnalyzer:
         
         return fig
 
-    def create_collaboration_map(self, df: pd.DataFrame) -> go.Figure:
+    def create_collaboration_map(self, df: pd.DataFrame,
+                                 aggregates: Optional[Dict[str, pd.Series]] = None) -> go.Figure:
         """
         Create a chloropleth map of collaborations by country using country_converter
+        
+        Args:
+            df (pd.DataFrame): Collaboration data
+            aggregates (Dict[str, pd.Series], optional): Precomputed counts from compute_aggregates
         """
         if df.empty:
             fig = go.Figure()
@@ -183,17 +421,16 @@ class OpenAlexAnalyzer:
             return fig
         
         try:
-            import country_converter as coco
-            cc = coco.CountryConverter()
+            country_lookup = self._country_lookup
             
             # Clean and prepare country data
-            country_counts = df['country'].value_counts()
+            country_counts = aggregates['countries'] if aggregates else df['country'].value_counts()
             country_counts = country_counts[country_counts.index != 'US']  # Remove US if needed
             country_counts = country_counts.rename_axis('country_code').reset_index(name='num_collaborations')
             
             # Convert country codes to names and ISO3
-            country_counts['country_name'] = cc.pandas_convert(country_counts['country_code'], to='name_short')
-            country_counts['country_code_ISO3'] = cc.pandas_convert(country_counts['country_code'], to='ISO3')
+            country_counts['country_code'] = country_counts['country_code'].astype(object)
+            country_counts = country_counts.join(country_lookup, on='country_code')
             
             # Create the choropleth map
             fig = px.choropleth(
@@ -232,9 +469,15 @@ class OpenAlexAnalyzer:
             self.logger.warning("country_converter package not found. Using basic country codes.")
             return self._create_basic_collaboration_map(df)
 
-    def create_collaboration_trends(self, df: pd.DataFrame, top_n: int = 10) -> go.Figure:
+    def create_collaboration_trends(self, df: pd.DataFrame, top_n: int = 10,
+                                    aggregates: Optional[Dict[str, pd.Series]] = None) -> go.Figure:
         """
         Create a line plot showing collaboration trends for top countries over time
+        
+        Args:
+            df (pd.DataFrame): Collaboration data
+            top_n (int): Number of top countries to show (default: 10)
+            aggregates (Dict[str, pd.Series], optional): Precomputed counts from compute_aggregates
         """
         if df.empty:
             fig = go.Figure()
@@ -244,23 +487,24 @@ class OpenAlexAnalyzer:
             return fig
         
         try:
-            import country_converter as coco
-            cc = coco.CountryConverter()
+            country_lookup = self._country_lookup
             
             # Group by year and country
-            country_by_year = df.groupby(['year', 'country']).size().reset_index(name='count')
+            country_by_year = (aggregates['country_year'] if aggregates
+                               else df.groupby(['year', 'country'], observed=True).size())
+            country_by_year = country_by_year.reset_index(name='count')
             
             # Convert country codes to names
-            country_by_year['country_name'] = cc.pandas_convert(country_by_year['country'], to='name_short')
+            country_by_year['country_name'] = country_by_year['country'].astype(object).map(
+                country_lookup['country_name'])
             
             # Remove US collaborations if needed
             country_by_year = country_by_year[country_by_year['country'] != 'US']
             
             # Get top N countries
-            top_countries = (country_by_year.groupby('country')['count']
+            top_countries = (country_by_year.groupby('country', observed=True)['count']
                             .sum()
-                            .sort_values(ascending=False)
-                            .head(top_n)
+                            .nlargest(top_n)
                             .index)
             
             country_by_year_subset = country_by_year[country_by_year['country'].isin(top_countries)]
@@ -298,13 +542,15 @@ class OpenAlexAnalyzer:
         # Original implementation goes here
         return super().create_collaboration_map(df)
 
-    def create_institution_network_visualization(self, df: pd.DataFrame, top_n: int = 20) -> go.Figure:
+    def create_institution_network_visualization(self, df: pd.DataFrame, top_n: int = 20,
+                                                 aggregates: Optional[Dict[str, pd.Series]] = None) -> go.Figure:
         """
         Create an interactive network visualization of collaborating institutions
         
         Args:
             df (pd.DataFrame): Collaboration data
             top_n (int): Number of top collaborating institutions to show (default: 20)
+            aggregates (Dict[str, pd.Series], optional): Precomputed counts from compute_aggregates
         """
         if df.empty:
             fig = go.Figure()
@@ -313,35 +559,25 @@ class OpenAlexAnalyzer:
                              x=0.5, y=0.5, showarrow=False)
             return fig
 
-        # Create network
-        G = nx.Graph()
-        
         # Count collaborations per institution
-        collaboration_counts = df['collaborating_institution'].value_counts()
+        collaboration_counts = (aggregates['institutions'] if aggregates
+                                else df['collaborating_institution'].value_counts())
         
         # Get top N collaborating institutions
         top_institutions = collaboration_counts.head(top_n)
+        top_institutions = top_institutions[top_institutions.index.notna()]
         
-        # Add edges with weights based on number of collaborations
-        for inst, count in top_institutions.items():
-            if pd.notna(inst):
-                G.add_edge('Source Institution', inst, weight=count)
-        
-        # Calculate node positions using a spring layout
-        # Adjust k parameter to spread out nodes more
-        pos = nx.spring_layout(G, k=1/np.sqrt(len(G.nodes())), iterations=50)
-        
-        # Create edges trace with varying line thickness based on weight
-        edge_x = []
-        edge_y = []
-        edge_weights = []
+        # Every edge joins the source institution to a collaborator, so the star is laid
+        # out in closed form: source at the origin, collaborators evenly spaced on a circle
+        angles = np.linspace(0, 2 * np.pi, len(top_institutions), endpoint=False)
+        inst_x = np.cos(angles)
+        inst_y = np.sin(angles)
         
-        for edge in G.edges(data=True):
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-            edge_weights.extend([edge[2].get('weight', 1), edge[2].get('weight', 1), None])
+        # Create edges trace as flat (start, end, NaN) triples; Plotly breaks lines at NaN
+        origin = np.zeros(len(angles))
+        gaps = np.full(len(angles), np.nan)
+        edge_x = np.column_stack([origin, inst_x, gaps]).ravel()
+        edge_y = np.column_stack([origin, inst_y, gaps]).ravel()
         
         edge_trace = go.Scatter(
             x=edge_x, y=edge_y,
@@ -349,29 +585,16 @@ class OpenAlexAnalyzer:
             hoverinfo='none',
             mode='lines')
         
-        # Create nodes trace
-        node_x = []
-        node_y = []
-        node_text = []
-        node_size = []
-        node_color = []
-        
-        for node in G.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-            
-            # Add number of collaborations to node text
-            if node == 'Source Institution':
-                node_text.append(f"Source Institution<br>Total Collaborations: {sum(top_institutions)}")
-                node_size.append(40)
-                node_color.append('#ff7f0e')  # Orange for source
-            else:
-                collab_count = collaboration_counts[node]
-                node_text.append(f"{node}<br>Collaborations: {collab_count}")
-                # Size nodes based on collaboration count
-                node_size.append(20 + (collab_count / top_institutions.max()) * 20)
-                node_color.append('#1f77b4')  # Blue for collaborators
+        # Create nodes trace, source first
+        counts = top_institutions.to_numpy()
+        node_x = np.concatenate([[0.0], inst_x])
+        node_y = np.concatenate([[0.0], inst_y])
+        node_text = ([f"Source Institution<br>Total Collaborations: {counts.sum()}"] +
+                     [f"{inst}<br>Collaborations: {count}"
+                      for inst, count in zip(top_institutions.index, counts)])
+        # Size collaborator nodes based on collaboration count
+        node_size = np.concatenate([[40], 20 + counts / counts.max() * 20]) if len(counts) else [40]
+        node_color = ['#ff7f0e'] + ['#1f77b4'] * len(counts)  # Orange for source, blue for collaborators
         
         node_trace = go.Scatter(
             x=node_x, y=node_y,
@@ -408,9 +631,14 @@ class OpenAlexAnalyzer:
         
         return fig
 
-    def create_collaboration_summary(self, df: pd.DataFrame) -> go.Figure:
+    def create_collaboration_summary(self, df: pd.DataFrame,
+                                     aggregates: Optional[Dict[str, pd.Series]] = None) -> go.Figure:
         """
         Create a summary visualization of collaboration patterns
+        
+        Args:
+            df (pd.DataFrame): Collaboration data
+            aggregates (Dict[str, pd.Series], optional): Precomputed counts from compute_aggregates
         """
         if df.empty:
             fig = go.Figure()
@@ -425,7 +653,9 @@ class OpenAlexAnalyzer:
                                          'Collaborations by Year'))
 
         # Top collaborating institutions
-        top_institutions = df['collaborating_institution'].value_counts().head(10)
+        institution_counts = (aggregates['institutions'] if aggregates
+                              else df['collaborating_institution'].value_counts())
+        top_institutions = institution_counts.head(10)
         fig.add_trace(
             go.Bar(x=top_institutions.values, 
                    y=top_institutions.index, 
@@ -435,7 +665,7 @@ class OpenAlexAnalyzer:
         )
 
         # Collaborations by year
-        yearly_counts = df.groupby('year').size()
+        yearly_counts = aggregates['yearly'] if aggregates else df.groupby('year').size()
         fig.add_trace(
             go.Scatter(x=yearly_counts.index, 
                       y=yearly_counts.values,
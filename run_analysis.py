@@ -3,6 +3,8 @@ from openalex_analyzer import OpenAlexAnalyzer
 import plotly.io as pio
 import networkx as nx
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import numpy as np
 
 def get_institution_name(analyzer, institution_id: str) -> str:
@@ -32,32 +34,37 @@ def main():
     
     os.makedirs(dir_name, exist_ok=True)
     
-    # Get collaboration data
+    # Get collaboration data, writing the raw rows to Parquet as pages arrive and
+    # loading back only the columns the visualizations use
     df = analyzer.get_institution_collaborations(
         institution_id=institution_id,
         start_year=2020,
-        end_year=2023
+        end_year=2023,
+        parquet_path=f'{dir_name}/collaboration_data.parquet',
+        columns=['year', 'collaborating_institution', 'country']
     )
     
-    # Save raw data
-    df.to_csv(f'{dir_name}/collaboration_data.csv', index=False)
-    
-    # Create and save all visualizations
+    # Compute shared counts once, then create and save all visualizations
+    aggregates = analyzer.compute_aggregates(df)
     visualizations = {
-        'collaborations_over_time': analyzer.visualize_collaborations_over_time(df),
-        'collaboration_map': analyzer.create_collaboration_map(df),
-        'collaboration_trends': analyzer.create_collaboration_trends(df, top_n=10),
-        'institution_network_top20': analyzer.create_institution_network_visualization(df, top_n=20),
-        'institution_network_top50': analyzer.create_institution_network_visualization(df, top_n=50),
-        'collaboration_summary': analyzer.create_collaboration_summary(df)
+        'collaborations_over_time': analyzer.visualize_collaborations_over_time(df, aggregates=aggregates),
+        'collaboration_map': analyzer.create_collaboration_map(df, aggregates=aggregates),
+        'collaboration_trends': analyzer.create_collaboration_trends(df, top_n=10, aggregates=aggregates),
+        'institution_network_top20': analyzer.create_institution_network_visualization(df, top_n=20, aggregates=aggregates),
+        'institution_network_top50': analyzer.create_institution_network_visualization(df, top_n=50, aggregates=aggregates),
+        'collaboration_summary': analyzer.create_collaboration_summary(df, aggregates=aggregates)
     }
     
-    # Save all visualizations
-    for name, fig in visualizations.items():
-        pio.write_html(fig, f'{dir_name}/{name}.html')
+    # Save all visualizations; HTML serialization is CPU-bound, so write each in its own process
+    paths = [f'{dir_name}/{name}.html' for name in visualizations]
+    with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+        # Load plotly.js from the CDN instead of embedding ~3.5 MB in every file
+        write_html = partial(pio.write_html, include_plotlyjs='cdn', validate=False, auto_open=False)
+        list(executor.map(write_html, visualizations.values(), paths))
     
-    # Create and save network graph
-    network = analyzer.create_collaboration_network(df)
+    # Create and save network graph of the top 200 collaborators; the long tail of
+    # one-off collaborators would dominate the GEXF file
+    network = analyzer.create_collaboration_network(df, top_n=200)
     nx.write_gexf(network, f'{dir_name}/collaboration_network.gexf')
     
     print(f"Analysis complete! Results saved in '{dir_name}' folder")